@@ -0,0 +1,144 @@
+from typing import List, Optional, Annotated
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic.dataclasses import dataclass
+from pydantic.functional_validators import AfterValidator, BeforeValidator
+
+if __package__:
+    from .patient import (
+        AddressType,
+        AddressUse,
+        ContactSystem,
+        ContactUse,
+        Gender,
+        NameUse,
+        validate_contact_value,
+        validate_date_format,
+    )
+else:
+    from patient import (
+        AddressType,
+        AddressUse,
+        ContactSystem,
+        ContactUse,
+        Gender,
+        NameUse,
+        validate_contact_value,
+        validate_date_format,
+    )
+
+
+def _ensure_list(v):
+    return [v] if isinstance(v, str) else v
+
+
+# The format check runs after the str check, so wrong types are reported by
+# Pydantic instead of escaping as a TypeError from the regex
+DateString = Annotated[str, AfterValidator(validate_date_format)]
+StrOrList = Annotated[Optional[List[str]], BeforeValidator(_ensure_list)]
+
+# Nested input objects reject unknown keys, which catches misspelled fields
+_NESTED_CONFIG = ConfigDict(extra="forbid", validate_assignment=False)
+
+
+class IdentifierType(BaseModel):
+    model_config = _NESTED_CONFIG
+
+    system: str = Field(..., description="URL of the coding system")
+    code: str = Field(..., description="Code from the system")
+
+
+class Identifier(BaseModel):
+    model_config = _NESTED_CONFIG
+
+    system: str = Field(..., description="System that defines the identifier")
+    value: str = Field(..., description="The value that is unique within the system")
+    type: Optional[str] = Field(None, description="Type of identifier")
+
+
+class HumanName(BaseModel):
+    model_config = _NESTED_CONFIG
+
+    use: Optional[NameUse] = Field(None, description="The use of this name")
+    family: Optional[str] = Field(
+        None, description="Family name (often called 'Surname')"
+    )
+    given: StrOrList = Field(
+        None, description="Given names (not always 'first'). Includes middle names"
+    )
+    prefix: StrOrList = Field(None, description="Parts that come before the name")
+    suffix: StrOrList = Field(None, description="Parts that come after the name")
+
+
+class ContactPoint(BaseModel):
+    model_config = _NESTED_CONFIG
+
+    system: ContactSystem = Field(..., description="Type of contact point")
+    value: str = Field(..., description="The actual contact point details")
+    use: Optional[ContactUse] = Field(None, description="Purpose of this contact point")
+
+    @model_validator(mode="after")
+    def validate_contact_value(self):
+        validate_contact_value(self.system, self.value)
+        return self
+
+
+class Address(BaseModel):
+    model_config = _NESTED_CONFIG
+
+    use: Optional[AddressUse] = Field(None, description="Purpose of this address")
+    type: Optional[AddressType] = Field(None, description="Postal, physical, etc.")
+    line: StrOrList = Field(
+        None, description="Street name, number, direction & P.O. Box etc."
+    )
+    city: Optional[str] = Field(None, description="Name of city, town etc.")
+    state: Optional[str] = Field(
+        None, description="Sub-unit of country (state, region, province etc.)"
+    )
+    postalCode: Optional[str] = Field(None, description="Postal code for area")
+    country: Optional[str] = Field(
+        None, description="Country (e.g. can be ISO 3166 2 or 3 letter code)"
+    )
+
+
+@dataclass(slots=True, config=_NESTED_CONFIG)
+class Language:
+    code: str = Field(..., description="Language code (BCP-47)")
+    display: str = Field(..., description="Language display name")
+    preferred: Optional[bool] = Field(
+        False, description="Language preference indicator"
+    )
+
+
+class PatientInput(BaseModel):
+    identifiers: Optional[List[Identifier]] = Field(
+        None, description="Patient identifiers"
+    )
+    names: List[HumanName] = Field(
+        ..., min_length=1, description="Patient names (at least one required)"
+    )
+    contacts: Optional[List[ContactPoint]] = Field(
+        None, description="Patient contact points"
+    )
+    gender: Optional[Gender] = Field(None, description="Patient gender")
+    birthDate: Optional[DateString] = Field(
+        None, description="Patient birth date in YYYY-MM-DD format"
+    )
+    addresses: Optional[List[Address]] = Field(None, description="Patient addresses")
+    maritalStatus: Optional[str] = Field(
+        None, description="Patient marital status code"
+    )
+    languages: Optional[List[Language]] = Field(None, description="Patient languages")
+
+    @model_validator(mode="after")
+    def validate_names(self):
+        if not any(
+            name.family or (name.given and len(name.given) > 0) for name in self.names
+        ):
+            raise ValueError(
+                "At least one name must have either a family name or a given name"
+            )
+        return self
+
+
+# Calling the core validator directly skips BaseModel.__init__
+_PATIENT_VALIDATOR = PatientInput.__pydantic_validator__
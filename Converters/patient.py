@@ -1,10 +1,10 @@
 from datetime import datetime
-from typing import List, Optional, Annotated, Dict
-from pydantic import BaseModel, Field, model_validator
-from pydantic.functional_validators import BeforeValidator
+from functools import cache, lru_cache
+from typing import List, Optional, Dict
 from enum import Enum
 import re
 import json
+import sys
 
 
 class FHIRValidationError(Exception):
@@ -60,137 +60,316 @@ class AddressType(str, Enum):
     BOTH = "both"
 
 
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_CURRENT_YEAR = datetime.now().year
+
+
 def validate_date_format(v: str) -> str:
+    global _CURRENT_YEAR
     if not v:
         return v
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", v):
+    if not _DATE_RE.fullmatch(v):
         raise ValueError("Date must be in YYYY-MM-DD format")
     try:
-        date = datetime.strptime(v, "%Y-%m-%d")
-        year = date.year
-        current_year = datetime.now().year
-        if not (1900 <= year <= current_year):
+        year = int(v[:4])
+        # Constructing the date checks the month/day ranges
+        datetime(year, int(v[5:7]), int(v[8:10]))
+        if year > _CURRENT_YEAR:
+            # The cached year may be stale in a long-running process
+            _CURRENT_YEAR = datetime.now().year
+        if not (1900 <= year <= _CURRENT_YEAR):
             raise ValueError("Birth year must be between 1900 and current year")
     except ValueError as e:
         raise ValueError(f"Invalid date: {str(e)}")
     return v
 
 
-DateString = Annotated[str, BeforeValidator(validate_date_format)]
+def validate_contact_value(system: str, value: str) -> str:
+    if system == ContactSystem.EMAIL:
+        if not _EMAIL_RE.fullmatch(value):
+            raise ValueError("Invalid email format")
+    elif system == ContactSystem.PHONE:
+        cleaned = value.translate(_NON_DIGITS)
+        if not cleaned.isascii():
+            cleaned = "".join(filter(str.isdigit, cleaned))
+        if not 8 <= len(cleaned) <= 15:
+            raise ValueError("Invalid phone number length")
+    return value
+
+
+_HUMAN_NAME_FIELDS = ("use", "family", "given", "prefix", "suffix")
+_ADDRESS_FIELDS = (
+    "use",
+    "type",
+    "line",
+    "city",
+    "state",
+    "postalCode",
+    "country",
+)
+
+# Deletes every ASCII character that is not a digit
+_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
+
+# The Pydantic models live in _models and are only imported when the
+# validating path needs them, so importing this module stays cheap.
+_MODEL_NAMES = frozenset(
+    (
+        "DateString",
+        "IdentifierType",
+        "Identifier",
+        "HumanName",
+        "ContactPoint",
+        "Address",
+        "Language",
+        "PatientInput",
+    )
+)
 
 
-class IdentifierType(BaseModel):
-    system: str = Field(..., description="URL of the coding system")
-    code: str = Field(..., description="Code from the system")
+@cache
+def _load_models():
+    """
+    Import the Pydantic models on first use. Returns the _models module and
+    pydantic's ValidationError, so neither import runs per conversion.
+    """
+    from pydantic import ValidationError
 
+    # Converters is importable both as a package and as a plain directory of
+    # modules (the demo scripts run from inside it)
+    if __package__:
+        from . import _models
+    else:
+        import _models
 
-class Identifier(BaseModel):
-    system: str = Field(..., description="System that defines the identifier")
-    value: str = Field(..., description="The value that is unique within the system")
-    type: Optional[str] = Field(None, description="Type of identifier")
+    return _models, ValidationError
 
 
-class HumanName(BaseModel):
-    use: Optional[NameUse] = Field(None, description="The use of this name")
-    family: Optional[str] = Field(
-        None, description="Family name (often called 'Surname')"
-    )
-    given: Optional[List[str]] = Field(
-        None, description="Given names (not always 'first'). Includes middle names"
-    )
-    prefix: Optional[List[str]] = Field(
-        None, description="Parts that come before the name"
-    )
-    suffix: Optional[List[str]] = Field(
-        None, description="Parts that come after the name"
-    )
+def __getattr__(name):
+    if name in _MODEL_NAMES:
+        return getattr(_load_models()[0], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    @model_validator(mode="before")
-    @classmethod
-    def convert_string_to_list(cls, values):
-        for field in ["given", "prefix", "suffix"]:
-            if isinstance(values.get(field), str):
-                values[field] = [values[field]]
-        return values
-
-
-class ContactPoint(BaseModel):
-    system: ContactSystem = Field(..., description="Type of contact point")
-    value: str = Field(..., description="The actual contact point details")
-    use: Optional[ContactUse] = Field(None, description="Purpose of this contact point")
-
-    @model_validator(mode="after")
-    def validate_contact_value(self):
-        if self.system == ContactSystem.EMAIL:
-            if "@" not in self.value or "." not in self.value:
-                raise ValueError("Invalid email format")
-        elif self.system == ContactSystem.PHONE:
-            cleaned = "".join(filter(str.isdigit, self.value))
-            if not 8 <= len(cleaned) <= 15:
-                raise ValueError("Invalid phone number length")
-        return self
-
-
-class Address(BaseModel):
-    use: Optional[AddressUse] = Field(None, description="Purpose of this address")
-    type: Optional[AddressType] = Field(None, description="Postal, physical, etc.")
-    line: Optional[List[str]] = Field(
-        None, description="Street name, number, direction & P.O. Box etc."
-    )
-    city: Optional[str] = Field(None, description="Name of city, town etc.")
-    state: Optional[str] = Field(
-        None, description="Sub-unit of country (state, region, province etc.)"
-    )
-    postalCode: Optional[str] = Field(None, description="Postal code for area")
-    country: Optional[str] = Field(
-        None, description="Country (e.g. can be ISO 3166 2 or 3 letter code)"
-    )
 
-    @model_validator(mode="before")
-    @classmethod
-    def convert_line_to_list(cls, values):
-        if isinstance(values.get("line"), str):
-            values["line"] = [values["line"]]
-        return values
+@cache
+def _json_dumps():
+    # orjson is optional; fall back to the stdlib encoder with the same
+    # compact output when it is not installed
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+    return orjson.dumps
 
 
-class Language(BaseModel):
-    code: str = Field(..., description="Language code (BCP-47)")
-    display: str = Field(..., description="Language display name")
-    preferred: Optional[bool] = Field(
-        False, description="Language preference indicator"
-    )
+# Literals such as "Patient" or "resourceType" are interned by the compiler
+# already; the URLs are not, since they are not identifier-like.
+_IDENTIFIER_TYPE_SYSTEM = sys.intern("http://terminology.hl7.org/CodeSystem/v2-0203")
+_MARITAL_STATUS_SYSTEM = sys.intern(
+    "http://terminology.hl7.org/CodeSystem/v3-MaritalStatus"
+)
+_LANGUAGE_SYSTEM = sys.intern("urn:ietf:bcp:47")
 
 
-class PatientInput(BaseModel):
-    identifiers: Optional[List[Identifier]] = Field(
-        None, description="Patient identifiers"
-    )
-    names: List[HumanName] = Field(
-        ..., min_items=1, description="Patient names (at least one required)"
-    )
-    contacts: Optional[List[ContactPoint]] = Field(
-        None, description="Patient contact points"
-    )
-    gender: Optional[Gender] = Field(None, description="Patient gender")
-    birthDate: Optional[DateString] = Field(
-        None, description="Patient birth date in YYYY-MM-DD format"
-    )
-    addresses: Optional[List[Address]] = Field(None, description="Patient addresses")
-    maritalStatus: Optional[str] = Field(
-        None, description="Patient marital status code"
-    )
-    languages: Optional[List[Language]] = Field(None, description="Patient languages")
-
-    @model_validator(mode="after")
-    def validate_names(self):
-        if not any(
-            name.family or (name.given and len(name.given) > 0) for name in self.names
-        ):
-            raise ValueError(
-                "At least one name must have either a family name or a given name"
-            )
-        return self
+@lru_cache(maxsize=64)
+def _identifier_type_coding(code: str) -> Dict:
+    """
+    Identifier type CodeableConcept for a v2-0203 code. The result is cached
+    and shared between resources, so it must not be mutated.
+    """
+    return {"coding": [{"system": _IDENTIFIER_TYPE_SYSTEM, "code": code}]}
+
+
+@lru_cache(maxsize=64)
+def _marital_status_coding(code: str) -> Dict:
+    """
+    Marital status CodeableConcept for a v3-MaritalStatus code. Cached and
+    shared like _identifier_type_coding.
+    """
+    return {"coding": [{"system": _MARITAL_STATUS_SYSTEM, "code": code}]}
+
+
+def _language_coding(code: str, display: str) -> Dict:
+    return {
+        "coding": [{"system": _LANGUAGE_SYSTEM, "code": code, "display": display}]
+    }
+
+
+_GENDER_VALUES = frozenset(Gender._value2member_map_)
+_NAME_USE_VALUES = frozenset(NameUse._value2member_map_)
+_CONTACT_SYSTEM_VALUES = frozenset(ContactSystem._value2member_map_)
+_CONTACT_USE_VALUES = frozenset(ContactUse._value2member_map_)
+_ADDRESS_USE_VALUES = frozenset(AddressUse._value2member_map_)
+_ADDRESS_TYPE_VALUES = frozenset(AddressType._value2member_map_)
+
+_IDENTIFIER_KEYS = frozenset(("system", "value", "type"))
+_HUMAN_NAME_KEYS = frozenset(_HUMAN_NAME_FIELDS)
+_CONTACT_KEYS = frozenset(("system", "value", "use"))
+_ADDRESS_KEYS = frozenset(_ADDRESS_FIELDS)
+_LANGUAGE_KEYS = frozenset(("code", "display", "preferred"))
+
+
+def _check_str(d: Dict, field: str, required: bool = False) -> Optional[str]:
+    v = d.get(field)
+    if v is None:
+        if required:
+            raise ValueError(f"{field}: Field required")
+    elif not isinstance(v, str):
+        raise ValueError(f"{field}: Input should be a valid string")
+    return v
+
+
+def _check_code(d: Dict, field: str, allowed: frozenset, required: bool = False):
+    v = d.get(field)
+    if v is None:
+        if required:
+            raise ValueError(f"{field}: Field required")
+    elif not isinstance(v, str) or v not in allowed:
+        raise ValueError(f"{field}: Input should be one of {sorted(allowed)}")
+    return v
+
+
+def _check_str_list(d: Dict, field: str) -> Optional[List[str]]:
+    v = d.get(field)
+    if isinstance(v, str):
+        return [v]
+    if v is not None and not (
+        isinstance(v, list) and all(isinstance(item, str) for item in v)
+    ):
+        raise ValueError(f"{field}: Input should be a valid list of strings")
+    return v
+
+
+def _check_list(d: Dict, field: str, keys: frozenset) -> List[Dict]:
+    v = d.get(field)
+    if v is None:
+        return []
+    if not isinstance(v, list) or not all(isinstance(item, dict) for item in v):
+        raise ValueError(f"{field}: Input should be a valid list of objects")
+    for item in v:
+        if not item.keys() <= keys:
+            extra = sorted(item.keys() - keys)
+            raise ValueError(f"{field}: Extra inputs are not permitted: {extra}")
+    return v
+
+
+def _fast_identifier(d: Dict) -> Dict:
+    type_code = _check_str(d, "type")
+    return {
+        "system": _check_str(d, "system", required=True),
+        "value": _check_str(d, "value", required=True),
+        "type": _identifier_type_coding(type_code) if type_code else None,
+    }
+
+
+def _fast_name(d: Dict) -> Dict:
+    name = {
+        "use": _check_code(d, "use", _NAME_USE_VALUES),
+        "family": _check_str(d, "family"),
+        "given": _check_str_list(d, "given"),
+        "prefix": _check_str_list(d, "prefix"),
+        "suffix": _check_str_list(d, "suffix"),
+    }
+    return {k: v for k, v in name.items() if v is not None}
+
+
+def _fast_contact(d: Dict) -> Dict:
+    system = _check_code(d, "system", _CONTACT_SYSTEM_VALUES, required=True)
+    value = _check_str(d, "value", required=True)
+    return {
+        "system": system,
+        "value": validate_contact_value(system, value),
+        "use": _check_code(d, "use", _CONTACT_USE_VALUES),
+    }
+
+
+def _fast_address(d: Dict) -> Dict:
+    address = {
+        "use": _check_code(d, "use", _ADDRESS_USE_VALUES),
+        "type": _check_code(d, "type", _ADDRESS_TYPE_VALUES),
+        "line": _check_str_list(d, "line"),
+        "city": _check_str(d, "city"),
+        "state": _check_str(d, "state"),
+        "postalCode": _check_str(d, "postalCode"),
+        "country": _check_str(d, "country"),
+    }
+    return {k: v for k, v in address.items() if v is not None}
+
+
+def _fast_language(d: Dict) -> Dict:
+    preferred = d.get("preferred", False)
+    if preferred is not None and not isinstance(preferred, bool):
+        raise ValueError("preferred: Input should be a valid boolean")
+    return {
+        "language": _language_coding(
+            _check_str(d, "code", required=True),
+            _check_str(d, "display", required=True),
+        ),
+        "preferred": preferred,
+    }
+
+
+def _fast_patient(form_data: Dict) -> Dict:
+    """
+    Validate form data and build the FHIR Patient Resource in a single pass,
+    without Pydantic. Mirrors the checks of PatientInput.
+    """
+    if not isinstance(form_data, dict):
+        raise ValueError("Input should be a valid dictionary")
+    patient_resource = {"resourceType": "Patient", "active": True}
+
+    identifiers = [
+        _fast_identifier(d)
+        for d in _check_list(form_data, "identifiers", _IDENTIFIER_KEYS)
+    ]
+    if identifiers:
+        patient_resource["identifier"] = identifiers
+
+    names = [_fast_name(d) for d in _check_list(form_data, "names", _HUMAN_NAME_KEYS)]
+    if not any(name.get("family") or name.get("given") for name in names):
+        raise ValueError(
+            "At least one name must have either a family name or a given name"
+        )
+    patient_resource["name"] = names
+
+    telecom = [
+        _fast_contact(d) for d in _check_list(form_data, "contacts", _CONTACT_KEYS)
+    ]
+    if telecom:
+        patient_resource["telecom"] = telecom
+
+    gender = _check_code(form_data, "gender", _GENDER_VALUES)
+    if gender:
+        patient_resource["gender"] = gender
+
+    birth_date = _check_str(form_data, "birthDate")
+    if birth_date:
+        patient_resource["birthDate"] = validate_date_format(birth_date)
+
+    addresses = [
+        _fast_address(d) for d in _check_list(form_data, "addresses", _ADDRESS_KEYS)
+    ]
+    if addresses:
+        patient_resource["address"] = addresses
+
+    marital_status = _check_str(form_data, "maritalStatus")
+    if marital_status:
+        patient_resource["maritalStatus"] = _marital_status_coding(marital_status)
+
+    communication = [
+        _fast_language(d)
+        for d in _check_list(form_data, "languages", _LANGUAGE_KEYS)
+    ]
+    if communication:
+        patient_resource["communication"] = communication
+
+    return patient_resource
 
 
 class FHIRPatientConverter:
@@ -199,12 +378,15 @@ class FHIRPatientConverter:
     """
 
     @staticmethod
-    def convert_to_fhir(form_data: Dict) -> Dict:
+    def convert_to_fhir(form_data: Dict, fast: bool = False) -> Dict:
         """
         Convert frontend form data to FHIR Patient Resource
 
         Args:
             form_data (Dict): The form data from frontend
+            fast (bool): Use the Pydantic-free, strict-type validation path
+                of convert_to_fhir_fast instead. Values are not coerced, so
+                e.g. "true" is rejected for a boolean field.
 
         Returns:
             Dict: FHIR Patient Resource
@@ -212,99 +394,155 @@ class FHIRPatientConverter:
         Raises:
             FHIRValidationError: If validation fails
         """
+        if fast:
+            return FHIRPatientConverter.convert_to_fhir_fast(form_data)
+
+        models, ValidationError = _load_models()
         try:
             # First validate the input data using Pydantic
-            validated_data = PatientInput(**form_data)
-
-            # Create the base resource
-            patient_resource = {"resourceType": "Patient", "active": True}
-
-            # Add identifiers
-            if validated_data.identifiers:
-                patient_resource["identifier"] = [
-                    {
-                        "system": identifier.system,
-                        "value": identifier.value,
-                        "type": {
-                            "coding": [
-                                {
-                                    "system": "http://terminology.hl7.org/CodeSystem/v2-0203",
-                                    "code": identifier.type,
-                                }
-                            ]
-                        }
-                        if identifier.type
-                        else None,
-                    }
-                    for identifier in validated_data.identifiers
-                ]
-
-            # Add names
-            if validated_data.names:
-                patient_resource["name"] = [
-                    {k: v for k, v in name.model_dump().items() if v is not None}
-                    for name in validated_data.names
-                ]
-
-            # Add telecom
-            if validated_data.contacts:
-                patient_resource["telecom"] = [
-                    {
-                        "system": contact.system,
-                        "value": contact.value,
-                        "use": contact.use,
-                    }
-                    for contact in validated_data.contacts
-                ]
-
-            # Add gender
-            if validated_data.gender:
-                patient_resource["gender"] = validated_data.gender
-
-            # Add birth date
-            if validated_data.birthDate:
-                patient_resource["birthDate"] = validated_data.birthDate
-
-            # Add addresses
-            if validated_data.addresses:
-                patient_resource["address"] = [
-                    {k: v for k, v in address.model_dump().items() if v is not None}
-                    for address in validated_data.addresses
-                ]
-
-            # Add marital status
-            if validated_data.maritalStatus:
-                patient_resource["maritalStatus"] = {
-                    "coding": [
-                        {
-                            "system": "http://terminology.hl7.org/CodeSystem/v3-MaritalStatus",
-                            "code": validated_data.maritalStatus,
-                        }
-                    ]
+            validated_data = models._PATIENT_VALIDATOR.validate_python(form_data)
+        except ValidationError as e:
+            raise FHIRValidationError(
+                f"Failed to convert to FHIR format: {str(e)}"
+            ) from None
+
+        # Create the base resource
+        patient_resource = {"resourceType": "Patient", "active": True}
+
+        # Add identifiers
+        if validated_data.identifiers:
+            patient_resource["identifier"] = [
+                {
+                    "system": identifier.system,
+                    "value": identifier.value,
+                    "type": _identifier_type_coding(identifier.type)
+                    if identifier.type
+                    else None,
+                }
+                for identifier in validated_data.identifiers
+            ]
+
+        # Add names
+        if validated_data.names:
+            patient_resource["name"] = [
+                {
+                    f: v
+                    for f in _HUMAN_NAME_FIELDS
+                    if (v := getattr(name, f)) is not None
                 }
+                for name in validated_data.names
+            ]
+
+        # Add telecom
+        if validated_data.contacts:
+            patient_resource["telecom"] = [
+                {
+                    "system": contact.system,
+                    "value": contact.value,
+                    "use": contact.use,
+                }
+                for contact in validated_data.contacts
+            ]
+
+        # Add gender
+        if validated_data.gender:
+            patient_resource["gender"] = validated_data.gender
+
+        # Add birth date
+        if validated_data.birthDate:
+            patient_resource["birthDate"] = validated_data.birthDate
+
+        # Add addresses
+        if validated_data.addresses:
+            patient_resource["address"] = [
+                {
+                    f: v
+                    for f in _ADDRESS_FIELDS
+                    if (v := getattr(address, f)) is not None
+                }
+                for address in validated_data.addresses
+            ]
+
+        # Add marital status
+        if validated_data.maritalStatus:
+            patient_resource["maritalStatus"] = _marital_status_coding(
+                validated_data.maritalStatus
+            )
+
+        # Add communication
+        if validated_data.languages:
+            patient_resource["communication"] = [
+                {
+                    "language": _language_coding(lang.code, lang.display),
+                    "preferred": lang.preferred,
+                }
+                for lang in validated_data.languages
+            ]
+
+        return patient_resource
+
+    @staticmethod
+    def convert_to_fhir_fast(form_data: Dict) -> Dict:
+        """
+        Convert frontend form data to FHIR Patient Resource using plain Python
+        checks instead of Pydantic. Checks the same fields as convert_to_fhir,
+        but types are strict: values Pydantic would coerce (e.g. "true" for a
+        boolean) are rejected. Error messages are also less detailed; use
+        convert_to_fhir when the full Pydantic error report is needed.
+
+        Args:
+            form_data (Dict): The form data from frontend
+
+        Returns:
+            Dict: FHIR Patient Resource
 
-            # Add communication
-            if validated_data.languages:
-                patient_resource["communication"] = [
-                    {
-                        "language": {
-                            "coding": [
-                                {
-                                    "system": "urn:ietf:bcp:47",
-                                    "code": lang.code,
-                                    "display": lang.display,
-                                }
-                            ]
-                        },
-                        "preferred": lang.preferred,
-                    }
-                    for lang in validated_data.languages
-                ]
-
-            return patient_resource
-
-        except Exception as e:
-            raise FHIRValidationError(f"Failed to convert to FHIR format: {str(e)}")
+        Raises:
+            FHIRValidationError: If validation fails
+        """
+        try:
+            return _fast_patient(form_data)
+        except ValueError as e:
+            raise FHIRValidationError(
+                f"Failed to convert to FHIR format: {str(e)}"
+            ) from None
+
+    @classmethod
+    def convert_to_fhir_json(cls, form_data: Dict, fast: bool = False) -> bytes:
+        """
+        Convert frontend form data to a JSON encoded FHIR Patient Resource.
+        Uses orjson when it is installed.
+
+        Args:
+            form_data (Dict): The form data from frontend
+            fast (bool): See convert_to_fhir
+
+        Returns:
+            bytes: FHIR Patient Resource as UTF-8 JSON
+
+        Raises:
+            FHIRValidationError: If validation fails
+        """
+        return _json_dumps()(cls.convert_to_fhir(form_data, fast))
+
+    @classmethod
+    def convert_many(
+        cls, form_data_list: List[Dict], fast: bool = False
+    ) -> List[Dict]:
+        """
+        Convert a batch of frontend form data to FHIR Patient Resources
+
+        Args:
+            form_data_list (List[Dict]): The form data records from frontend
+            fast (bool): See convert_to_fhir
+
+        Returns:
+            List[Dict]: FHIR Patient Resources, in input order
+
+        Raises:
+            FHIRValidationError: If validation fails for any record
+        """
+        convert = cls.convert_to_fhir
+        return [convert(form_data, fast) for form_data in form_data_list]
 
 
 # Example usage:
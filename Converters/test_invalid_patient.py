@@ -94,4 +94,5 @@ def test_invalid_data():
             print(f"Validation Error (expected): {e}")
 
 # Run the tests
-test_invalid_data()
+if __name__ == "__main__":
+    test_invalid_data()
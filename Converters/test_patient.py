@@ -1,4 +1,12 @@
 from patient import FHIRPatientConverter, FHIRValidationError
+from test_invalid_patient import (
+    invalid_contact_data,
+    invalid_date_data,
+    invalid_gender_data,
+    invalid_name_data,
+    missing_name_data,
+    multiple_invalid_data,
+)
 import json 
 
 
@@ -42,3 +50,49 @@ try:
     print(json.dumps(fhir_patient, indent=2))
 except FHIRValidationError as e:
     print(f"Validation error: {e}")
+
+
+# The Pydantic path and the Pydantic-free fast path must agree on both the
+# output and which inputs they reject
+def _convert_or_none(convert, data):
+    try:
+        return convert(data)
+    except FHIRValidationError:
+        return None
+
+
+parity_paths = {
+    "convert_to_fhir_fast": FHIRPatientConverter.convert_to_fhir_fast,
+    "convert_to_fhir(fast=True)": lambda d: FHIRPatientConverter.convert_to_fhir(
+        d, fast=True
+    ),
+    "convert_to_fhir_json": lambda d: json.loads(
+        FHIRPatientConverter.convert_to_fhir_json(d)
+    ),
+    "convert_to_fhir_json(fast=True)": lambda d: json.loads(
+        FHIRPatientConverter.convert_to_fhir_json(d, fast=True)
+    ),
+    "convert_many": lambda d: FHIRPatientConverter.convert_many([d])[0],
+    "convert_many(fast=True)": lambda d: FHIRPatientConverter.convert_many(
+        [d], fast=True
+    )[0],
+}
+parity_inputs = {
+    "form_data": form_data,
+    "invalid_gender_data": invalid_gender_data,
+    "invalid_date_data": invalid_date_data,
+    "invalid_contact_data": invalid_contact_data,
+    "invalid_name_data": invalid_name_data,
+    "missing_name_data": missing_name_data,
+    "multiple_invalid_data": multiple_invalid_data,
+    # Wrong types must be rejected by both paths, not escape as TypeError
+    "int_birth_date_data": {**form_data, "birthDate": 19900101},
+    "int_family_name_data": {**form_data, "names": [{"family": 42}]},
+}
+
+for input_name, data in parity_inputs.items():
+    expected = _convert_or_none(FHIRPatientConverter.convert_to_fhir, data)
+    for path_name, convert in parity_paths.items():
+        result = _convert_or_none(convert, data)
+        assert result == expected, f"{path_name} differs on {input_name}"
+print(f"Parity check passed for {len(parity_inputs)} inputs")
@@ -1,15 +1,20 @@
-import uuid  # For generating the ID
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+import os  # For generating the ID
+from dataclasses import fields
+from functools import lru_cache
+from operator import methodcaller
+from typing import List, Optional, Dict, Tuple
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from pydantic.dataclasses import dataclass
 from enum import Enum
 
-import json
-
 
 class FHIRValidationError(Exception):
     pass
 
 
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class NameUse(str, Enum):
     USUAL = "usual"
     OFFICIAL = "official"
@@ -34,25 +39,31 @@ class AddressType(str, Enum):
     BOTH = "both"
 
 
-class Coding(BaseModel):
+@dataclass(slots=True, config=_MODEL_CONFIG)
+class Coding:
     system: str = Field(..., description="System URL for the coding")
     code: str = Field(..., description="Code value from the system")
     display: Optional[str] = Field(None, description="Display text for the code")
 
 
 class CodeableConcept(BaseModel):
+    model_config = _MODEL_CONFIG
+
     coding: List[Coding] = Field(..., description="A list of codings")
     text: Optional[str] = Field(
         None, description="Plain text representation of the concept"
     )
 
 
-class IdentifierType(BaseModel):
+@dataclass(slots=True, config=_MODEL_CONFIG)
+class IdentifierType:
     system: str = Field(..., description="URL of the coding system")
     value: str = Field(..., description="Code from the system")
 
 
 class HumanName(BaseModel):
+    model_config = _MODEL_CONFIG
+
     use: Optional[NameUse] = Field(None, description="The use of this name")
     family: Optional[str] = Field(
         None, description="Family name (often called 'Surname')"
@@ -75,6 +86,8 @@ class HumanName(BaseModel):
 
 
 class Qualification(BaseModel):
+    model_config = _MODEL_CONFIG
+
     identifier: Optional[List[IdentifierType]] = Field(
         None, description="Identifier for the qualification"
     )
@@ -90,6 +103,8 @@ class Qualification(BaseModel):
 
 
 class Address(BaseModel):
+    model_config = _MODEL_CONFIG
+
     use: Optional[AddressUse] = Field(None, description="Purpose of this address")
     type: Optional[AddressType] = Field(None, description="Postal, physical, etc.")
     line: Optional[List[str]] = Field(
@@ -123,19 +138,288 @@ class Address(BaseModel):
 
 
 class PractitionerInput(BaseModel):
+    # Unknown top-level keys (e.g. resourceType) are ignored rather than
+    # rejected; only the nested models forbid them
+    model_config = ConfigDict(frozen=True)
+
     identifier: Optional[List[IdentifierType]] = Field(
         None, description="Practitioner identifiers"
     )
     active: Optional[bool] = Field(
-        None, description="Whether the practitioner is active"
+        True, description="Whether the practitioner is active"
     )
-    name: List[HumanName] = Field(..., min_items=1, description="Practitioner names")
+    name: List[HumanName] = Field(..., min_length=1, description="Practitioner names")
     address: Optional[List[Address]] = Field(None, description="Practitioner addresses")
     qualification: Optional[List[Qualification]] = Field(
         None, description="Practitioner qualifications"
     )
 
 
+# Calling the core validator directly skips BaseModel.__init__
+_PRACTITIONER_VALIDATOR = PractitionerInput.__pydantic_validator__
+# Validates a whole batch in a single call into pydantic-core
+_PRACTITIONER_LIST_VALIDATOR = TypeAdapter(List[PractitionerInput])
+_dump = methodcaller("model_dump", exclude_none=True)
+
+
+@lru_cache(maxsize=None)
+def _field_keys_for(model_cls: type) -> Tuple[str, ...]:
+    return tuple(model_cls.model_fields)
+
+
+def _dump_flat(model: BaseModel) -> Dict:
+    """
+    model_dump(exclude_none=True) for models without nested models, reading
+    the attributes directly
+    """
+    return {
+        k: v
+        for k in _field_keys_for(type(model))
+        if (v := getattr(model, k)) is not None
+    }
+
+
+# Shared by every resource, so it must not be mutated
+_PRACTITIONER_TEXT = {
+    "status": "generated",
+    "div": '<div xmlns="http://www.w3.org/1999/xhtml"><p>Practitioner Details</p></div>',
+}
+
+_NAME_USE_VALUES = frozenset(NameUse._value2member_map_)
+_ADDRESS_USE_VALUES = frozenset(AddressUse._value2member_map_)
+_ADDRESS_TYPE_VALUES = frozenset(AddressType._value2member_map_)
+
+_IDENTIFIER_KEYS = frozenset(f.name for f in fields(IdentifierType))
+_HUMAN_NAME_KEYS = frozenset(HumanName.model_fields)
+_ADDRESS_KEYS = frozenset(Address.model_fields)
+_QUALIFICATION_KEYS = frozenset(Qualification.model_fields)
+_CODEABLE_CONCEPT_KEYS = frozenset(CodeableConcept.model_fields)
+_CODING_KEYS = frozenset(f.name for f in fields(Coding))
+
+# The fast-path checks mirror the practitioner models, not the patient ones in
+# patient.py: nested objects forbid extra keys at every level and string lists
+# are plain List[str], so a bare string is rejected rather than wrapped. Helpers
+# whose contract differs from patient.py are named differently to keep the two
+# apart.
+
+def _check_keys(d, field: str, keys: frozenset) -> Dict:
+    if not isinstance(d, dict):
+        raise ValueError(f"{field}: Input should be a valid dictionary")
+    if not d.keys() <= keys:
+        extra = sorted(d.keys() - keys)
+        raise ValueError(f"{field}: Extra inputs are not permitted: {extra}")
+    return d
+
+
+def _check_dict_list(d: Dict, field: str, keys: frozenset, required: bool = False):
+    v = d.get(field)
+    if v is None:
+        if required:
+            raise ValueError(f"{field}: Field required")
+        return []
+    if not isinstance(v, list):
+        raise ValueError(f"{field}: Input should be a valid list")
+    return [_check_keys(item, field, keys) for item in v]
+
+
+def _check_str(d: Dict, field: str, required: bool = False) -> Optional[str]:
+    v = d.get(field)
+    if v is None:
+        if required:
+            raise ValueError(f"{field}: Field required")
+    elif not isinstance(v, str):
+        raise ValueError(f"{field}: Input should be a valid string")
+    return v
+
+
+def _check_code(d: Dict, field: str, allowed: frozenset) -> Optional[str]:
+    v = d.get(field)
+    if v is not None and (not isinstance(v, str) or v not in allowed):
+        raise ValueError(f"{field}: Input should be one of {sorted(allowed)}")
+    return v
+
+
+def _check_strict_str_list(d: Dict, field: str) -> Optional[List[str]]:
+    v = d.get(field)
+    if v is not None and not (
+        isinstance(v, list) and all(isinstance(item, str) for item in v)
+    ):
+        raise ValueError(f"{field}: Input should be a valid list of strings")
+    return v
+
+
+def _check_str_dict(d: Dict, field: str) -> Optional[Dict[str, str]]:
+    v = d.get(field)
+    if v is not None and not (
+        isinstance(v, dict)
+        and all(isinstance(k, str) and isinstance(x, str) for k, x in v.items())
+    ):
+        raise ValueError(f"{field}: Input should be a valid dictionary of strings")
+    return v
+
+
+def _fast_identifier(d: Dict) -> Dict:
+    return {
+        "system": _check_str(d, "system", required=True),
+        "value": _check_str(d, "value", required=True),
+    }
+
+
+def _fast_name(d: Dict) -> Dict:
+    name = {
+        "use": _check_code(d, "use", _NAME_USE_VALUES),
+        "family": _check_str(d, "family"),
+        "given": _check_strict_str_list(d, "given"),
+        "prefix": _check_strict_str_list(d, "prefix"),
+        "suffix": _check_strict_str_list(d, "suffix"),
+    }
+    return {k: v for k, v in name.items() if v is not None}
+
+
+def _fast_address(d: Dict) -> Dict:
+    address = {
+        "use": _check_code(d, "use", _ADDRESS_USE_VALUES),
+        "type": _check_code(d, "type", _ADDRESS_TYPE_VALUES),
+        "line": _check_strict_str_list(d, "line"),
+        "city": _check_str(d, "city"),
+        "state": _check_str(d, "state"),
+        "postalCode": _check_str(d, "postalCode"),
+        "country": _check_str(d, "country"),
+    }
+    return {k: v for k, v in address.items() if v is not None}
+
+
+def _fast_coding(d: Dict) -> Dict:
+    coding = {
+        "system": _check_str(d, "system", required=True),
+        "code": _check_str(d, "code", required=True),
+    }
+    display = _check_str(d, "display")
+    if display is not None:
+        coding["display"] = display
+    return coding
+
+
+def _fast_qualification(d: Dict) -> Dict:
+    # Optional keys are only inserted when present, in model field order, so
+    # no None-filtering pass is needed
+    qualification = {}
+    if d.get("identifier") is not None:
+        qualification["identifier"] = [
+            _fast_identifier(idf)
+            for idf in _check_dict_list(d, "identifier", _IDENTIFIER_KEYS)
+        ]
+
+    if "code" not in d:
+        raise ValueError("code: Field required")
+    code = _check_keys(d["code"], "code", _CODEABLE_CONCEPT_KEYS)
+    concept = {
+        "coding": [
+            _fast_coding(coding)
+            for coding in _check_dict_list(code, "coding", _CODING_KEYS, required=True)
+        ]
+    }
+    text = _check_str(code, "text")
+    if text is not None:
+        concept["text"] = text
+    qualification["code"] = concept
+
+    period = _check_str_dict(d, "period")
+    if period is not None:
+        qualification["period"] = period
+    issuer = _check_str_dict(d, "issuer")
+    if issuer is not None:
+        qualification["issuer"] = issuer
+    return qualification
+
+
+def _fast_practitioner(form_data: Dict) -> Dict:
+    """
+    Validate form data and build the FHIR Practitioner Resource in a single
+    pass, without Pydantic. Mirrors the checks of PractitionerInput.
+    """
+    if not isinstance(form_data, dict):
+        raise ValueError("input: Input should be a valid dictionary")
+    active = form_data.get("active")
+    if active is None:
+        active = True
+    elif not isinstance(active, bool):
+        raise ValueError("active: Input should be a valid boolean")
+
+    practitioner_resource = {
+        "resourceType": "Practitioner",
+        "id": FHIRPractitionerConverter.generate_id(),
+        "active": active,
+        "text": _PRACTITIONER_TEXT,
+    }
+
+    identifiers = [
+        _fast_identifier(d)
+        for d in _check_dict_list(form_data, "identifier", _IDENTIFIER_KEYS)
+    ]
+    if identifiers:
+        practitioner_resource["identifier"] = identifiers
+
+    names = [
+        _fast_name(d)
+        for d in _check_dict_list(form_data, "name", _HUMAN_NAME_KEYS, required=True)
+    ]
+    if not names:
+        raise ValueError("name: List should have at least 1 item")
+    practitioner_resource["name"] = names
+
+    addresses = [
+        _fast_address(d) for d in _check_dict_list(form_data, "address", _ADDRESS_KEYS)
+    ]
+    if addresses:
+        practitioner_resource["address"] = addresses
+
+    qualifications = [
+        _fast_qualification(d)
+        for d in _check_dict_list(form_data, "qualification", _QUALIFICATION_KEYS)
+    ]
+    if qualifications:
+        practitioner_resource["qualification"] = qualifications
+
+    return practitioner_resource
+
+
+def _build_practitioner(validated_data: PractitionerInput) -> Dict:
+    """
+    Build the FHIR Practitioner Resource from validated input
+    """
+    practitioner_resource = {
+        "resourceType": "Practitioner",
+        "id": FHIRPractitionerConverter.generate_id(),  # Auto-generate the ID
+        # An explicit null means "not given", so it defaults to active
+        "active": True if validated_data.active is None else validated_data.active,
+        "text": _PRACTITIONER_TEXT,
+    }
+
+    if validated_data.identifier:
+        practitioner_resource["identifier"] = [
+            {"system": identifier.system, "value": identifier.value}
+            for identifier in validated_data.identifier
+        ]
+
+    if validated_data.name:
+        practitioner_resource["name"] = [
+            _dump_flat(name) for name in validated_data.name
+        ]
+
+    if validated_data.address:
+        practitioner_resource["address"] = [
+            _dump_flat(address) for address in validated_data.address
+        ]
+
+    if validated_data.qualification:
+        practitioner_resource["qualification"] = [
+            _dump(qual) for qual in validated_data.qualification
+        ]
+
+    return practitioner_resource
+
+
 class FHIRPractitionerConverter:
     @staticmethod
     def generate_id() -> str:
@@ -145,73 +429,102 @@ class FHIRPractitionerConverter:
         Returns:
             str: A generated ID (UUID4).
         """
-        return str(uuid.uuid4())  # Using UUID4 for unique ID generation
+        # Formats the random bytes directly, which is about twice as fast as
+        # str(uuid.uuid4()); the version and variant bits are set as in RFC 4122
+        b = os.urandom(16)
+        return (
+            f"{b[:4].hex()}-{b[4:6].hex()}-4{b[6:8].hex()[1:]}-"
+            f"{(b[8] & 0x3F) | 0x80:02x}{b[9:10].hex()}-{b[10:].hex()}"
+        )
 
     @staticmethod
     def convert_to_fhir(form_data: Dict) -> Dict:
         try:
-            validated_data = PractitionerInput(**form_data)
-            practitioner_resource = {
-                "resourceType": "Practitioner",
-                "id": FHIRPractitionerConverter.generate_id(),  # Auto-generate the ID
-                "active": validated_data.active or True,
-                "text": {
-                    "status": "generated",
-                    "div": '<div xmlns="http://www.w3.org/1999/xhtml"><p>Practitioner Details</p></div>',
-                },
-            }
+            validated_data = _PRACTITIONER_VALIDATOR.validate_python(form_data)
+        except ValidationError as e:
+            raise FHIRValidationError(
+                f"Failed to convert to FHIR format: {str(e)}"
+            ) from None
+        return _build_practitioner(validated_data)
 
-            if validated_data.identifier:
-                practitioner_resource["identifier"] = [
-                    {"system": identifier.system, "value": identifier.value}
-                    for identifier in validated_data.identifier
-                ]
-
-            if validated_data.name:
-                practitioner_resource["name"] = [
-                    {k: v for k, v in name.dict().items() if v is not None}
-                    for name in validated_data.name
-                ]
-
-            if validated_data.address:
-                practitioner_resource["address"] = [
-                    {k: v for k, v in address.dict().items() if v is not None}
-                    for address in validated_data.address
-                ]
-
-            if validated_data.qualification:
-                practitioner_resource["qualification"] = [
-                    {
-                        "identifier": [
-                            {"system": idf.system, "value": idf.value}
-                            for idf in qual.identifier
-                        ]
-                        if qual.identifier
-                        else None,
-                        "code": {
-                            "coding": [
-                                {
-                                    "system": coding.system,
-                                    "code": coding.code,
-                                    "display": coding.display,
-                                }
-                                for coding in qual.code.coding
-                            ],
-                            "text": qual.code.text,
-                        },
-                        "period": qual.period,
-                        "issuer": qual.issuer,
-                    }
-                    for qual in validated_data.qualification
-                ]
+    @staticmethod
+    def convert_to_fhir_noraise(
+        form_data: Dict,
+    ) -> Tuple[Optional[Dict], Optional[List[Dict]]]:
+        """
+        Convert frontend form data to FHIR Practitioner Resource, returning
+        validation errors instead of raising them. Useful for batch callers
+        that collect failures per record.
 
-            return practitioner_resource
+        Args:
+            form_data (Dict): The form data from frontend
 
-        except Exception as e:
-            raise FHIRValidationError(f"Failed to convert to FHIR format: {str(e)}")
+        Returns:
+            Tuple[Optional[Dict], Optional[List[Dict]]]: The FHIR Practitioner
+                Resource and None, or None and the Pydantic error details
+        """
+        try:
+            validated_data = _PRACTITIONER_VALIDATOR.validate_python(form_data)
+        except ValidationError as e:
+            return None, e.errors(include_url=False)
+        return _build_practitioner(validated_data), None
+
+    @staticmethod
+    def convert_batch(form_data_list: List[Dict]) -> List[Dict]:
+        """
+        Convert a batch of frontend form data to FHIR Practitioner Resources.
+        The whole batch is validated at once, so a failure reports the errors
+        of every invalid record.
+
+        Args:
+            form_data_list (List[Dict]): The form data records from frontend
+
+        Returns:
+            List[Dict]: FHIR Practitioner Resources, in input order
+
+        Raises:
+            FHIRValidationError: If validation fails for any record
+        """
+        try:
+            validated_list = _PRACTITIONER_LIST_VALIDATOR.validate_python(
+                form_data_list
+            )
+        except ValidationError as e:
+            raise FHIRValidationError(
+                f"Failed to convert to FHIR format: {str(e)}"
+            ) from None
+        return [_build_practitioner(data) for data in validated_list]
+
+    @staticmethod
+    def convert_to_fhir_fast(form_data: Dict) -> Dict:
+        """
+        Convert frontend form data to FHIR Practitioner Resource using plain
+        Python checks instead of Pydantic. Applies the same rules as
+        convert_to_fhir, without Pydantic's lax type coercion and with less
+        detailed error messages.
+
+        Args:
+            form_data (Dict): The form data from frontend
+
+        Returns:
+            Dict: FHIR Practitioner Resource
+
+        Raises:
+            FHIRValidationError: If validation fails
+        """
+        try:
+            return _fast_practitioner(form_data)
+        except ValueError as e:
+            raise FHIRValidationError(
+                f"Failed to convert to FHIR format: {str(e)}"
+            ) from None
 
 
 if __name__ == "__main__":
+    import sys
+
+    import orjson
+
     sample_input = {
         "identifier": [{"system": "http://www.acme.org/practitioners", "value": "23"}],
         "active": True,
@@ -252,6 +565,66 @@ if __name__ == "__main__":
     converter = FHIRPractitionerConverter()
     try:
         fhir_data = converter.convert_to_fhir(sample_input)
-        print(json.dumps(fhir_data, indent=4))
+        sys.stdout.buffer.write(orjson.dumps(fhir_data, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
     except FHIRValidationError as e:
         print(str(e))
+
+    # active: false must be kept; null and a missing key default to true
+    active_cases = (({"active": False}, False), ({"active": None}, True), ({}, True))
+    for extra, expected in active_cases:
+        data = {"name": [{"family": "Careful"}], **extra}
+        for convert in (converter.convert_to_fhir, converter.convert_to_fhir_fast):
+            assert convert(data)["active"] is expected, (convert.__name__, extra)
+    print("active defaults check passed")
+
+    # Every conversion path must give the same resource (ids aside) and reject
+    # the same inputs as convert_to_fhir
+    def without_id(resource):
+        return {k: v for k, v in resource.items() if k != "id"}
+
+    def noraise(data):
+        resource, errors = converter.convert_to_fhir_noraise(data)
+        if errors is not None:
+            raise FHIRValidationError(errors)
+        return resource
+
+    parity_paths = {
+        "convert_to_fhir_fast": converter.convert_to_fhir_fast,
+        "convert_batch": lambda data: converter.convert_batch([data])[0],
+        "convert_to_fhir_noraise": noraise,
+    }
+    parity_inputs = {
+        "sample_input": sample_input,
+        "with_resource_type": {"resourceType": "Practitioner", **sample_input},
+        "missing_name": {"active": True},
+        "empty_name": {"name": []},
+        "invalid_name_use": {"name": [{"use": "nickname", "family": "Careful"}]},
+        "extra_address_key": {
+            "name": [{"family": "Careful"}],
+            "address": [{"city": "PleasantVille", "county": "Vic"}],
+        },
+        "invalid_identifier_value": {
+            "identifier": [
+                {"system": "http://www.acme.org/practitioners", "value": 23}
+            ],
+            "name": [{"family": "Careful"}],
+        },
+        "qualification_without_code": {
+            "name": [{"family": "Careful"}],
+            "qualification": [{"period": {"start": "1995"}}],
+        },
+        "not_a_dict": ["Careful"],
+    }
+    for input_name, data in parity_inputs.items():
+        try:
+            expected = without_id(converter.convert_to_fhir(data))
+        except FHIRValidationError:
+            expected = None
+        for path_name, convert in parity_paths.items():
+            try:
+                result = without_id(convert(data))
+            except FHIRValidationError:
+                result = None
+            assert result == expected, f"{path_name} differs on {input_name}"
+    print(f"Parity check passed for {len(parity_inputs)} inputs")
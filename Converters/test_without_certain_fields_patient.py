@@ -84,4 +84,5 @@ def test_address_validation():
         print(f"Validation Error (expected): {e}")
 
 # Run the tests
-test_address_validation()
+if __name__ == "__main__":
+    test_address_validation()
@@ -58,8 +58,11 @@ practitioner_data = {
     ],
 }
 
+# import orjson
+#
 # resp = session.put(
-#     f"{BASE_URL}/Practitioner/{practitioner_data['id']}", json=practitioner_data
+#     f"{BASE_URL}/Practitioner/{practitioner_data['id']}",
+#     data=orjson.dumps(practitioner_data),
 # )
 # Should create a new Practitioner
 # pp(resp.json())
@@ -70,5 +73,6 @@ practitioner_data = {
 # Fetch Practitioner
 #############################
 
-resp = session.get(f"{BASE_URL}/Practitioner/{practitioner_data['id']}")
-pp(resp.json())
+if __name__ == "__main__":
+    resp = session.get(f"{BASE_URL}/Practitioner/{practitioner_data['id']}")
+    pp(resp.json())